@@ -9,8 +9,14 @@ import sys
 import signal
 import typing
 import asyncio
+import importlib.util
 from libkirk.events import EventsHandler
 
+try:
+    import uvloop
+except ModuleNotFoundError:
+    pass
+
 
 # Kirk version
 VERSION = '1.1'
@@ -51,6 +57,43 @@ def get_event_loop() -> asyncio.BaseEventLoop:
     return loop
 
 
+def install_uvloop() -> None:
+    """
+    Use uvloop as event loop implementation, when it's available. It must be
+    called before the event loop is created. If a custom event loop policy
+    has been already set, it's not replaced.
+    Before python 3.10, asyncio primitives such as the events queue are bound
+    to the event loop when they are created, so uvloop is not used.
+    """
+    if sys.version_info < (3, 10):
+        return
+
+    if not importlib.util.find_spec("uvloop"):
+        return
+
+    policy = asyncio.get_event_loop_policy()
+    if not isinstance(policy, asyncio.DefaultEventLoopPolicy):
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def set_eager_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Use eager tasks factory for the given loop, when it's supported by the
+    current python version. Eager tasks start their execution as soon as
+    they are created, so they don't need to be scheduled in the loop when
+    they complete without suspending. Loop's task factory is not replaced
+    if a custom one has been already set.
+    """
+    # pylint: disable=no-member
+    if sys.version_info < (3, 12):
+        return
+
+    if loop.get_task_factory() is None:
+        loop.set_task_factory(asyncio.eager_task_factory)
+
+
 def create_task(coro: typing.Coroutine) -> asyncio.Task:
     """
     Create a new task.
@@ -7,27 +7,49 @@
 """
 import os
 import time
+import codecs
 import signal
 import asyncio
 import logging
-import contextlib
 from asyncio.subprocess import Process
+from asyncio.subprocess import SubprocessStreamProtocol
+import libkirk
 from libkirk.sut import SUT
 from libkirk.sut import IOBuffer
 from libkirk.sut import SUTError
 from libkirk.sut import KernelPanicError
 
 
+class ExitProtocol(SubprocessStreamProtocol):
+    """
+    Subprocess protocol which notifies when process has exited, even if its
+    stdout is still open.
+    """
+
+    def __init__(self, limit: int, loop: asyncio.AbstractEventLoop) -> None:
+        super().__init__(limit=limit, loop=loop)
+
+        self.exited = asyncio.Event()
+
+    def process_exited(self) -> None:
+        super().process_exited()
+
+        self.exited.set()
+
+
 class HostSUT(SUT):
     """
     SUT implementation using host's shell.
     """
-    BUFFSIZE = 1024
+    BUFFSIZE = 64 * 1024
+    FETCH_BUFFSIZE = 1024 * 1024
+    PANIC_MSG = b"Kernel panic"
 
     def __init__(self) -> None:
         self._logger = logging.getLogger("kirk.host")
-        self._fetch_lock = asyncio.Lock()
-        self._procs = []
+        self._fetch_locks = {}
+        self._fetch_users = {}
+        self._procs = set()
         self._running = False
         self._stop = False
 
@@ -51,26 +73,17 @@ class HostSUT(SUT):
     async def is_running(self) -> bool:
         return self._running
 
-    @staticmethod
-    async def _process_alive(proc: Process) -> bool:
-        """
-        Return True if process is alive and running.
-        """
-        with contextlib.suppress(asyncio.TimeoutError):
-            returncode = await asyncio.wait_for(proc.wait(), 1e-6)
-            if returncode is not None:
-                return False
-
-        return True
-
-    async def _kill_process(self, proc: Process) -> None:
+    def _kill_process(self, proc: Process) -> None:
         """
         Kill a process and all its subprocesses.
         """
         self._logger.info("Kill process %d", proc.pid)
 
+        # process is started with setsid(), so its pid is also the process
+        # group id. We don't use getpgid(), because it fails when process
+        # has terminated, while its subprocesses are still running
         try:
-            os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
+            os.killpg(proc.pid, signal.SIGKILL)
         except ProcessLookupError:
             # process has been killed already
             pass
@@ -103,25 +116,124 @@ class HostSUT(SUT):
                     "Terminating %d process(es)",
                     len(self._procs))
 
-                for proc in self._procs:
-                    await self._kill_process(proc)
+                # processes are removed from the set by run_command
+                # while we are waiting for them
+                procs = list(self._procs)
+
+                for proc in procs:
+                    self._kill_process(proc)
 
                 await asyncio.gather(*[
-                    proc.wait() for proc in self._procs
+                    proc.wait() for proc in procs
                 ])
 
                 self._logger.info("Process(es) terminated")
 
-            if self._fetch_lock.locked():
-                self._logging.info("Terminating data fetch")
+            fetch_locks = [
+                lock for lock in self._fetch_locks.values() if lock.locked()
+            ]
+
+            if fetch_locks:
+                self._logger.info("Terminating data fetch")
 
-                async with self._fetch_lock:
-                    pass
+                for lock in fetch_locks:
+                    async with lock:
+                        pass
         finally:
             self._stop = False
             self._running = False
             self._logger.info("SUT has stopped")
 
+    async def _spawn_process(self, command: str, kwargs: dict) -> tuple:
+        """
+        Spawn the process running ``command``.
+        :returns: (Process, asyncio.Event) tuple with the process and the
+            event which is set when process has exited
+        """
+        loop = libkirk.get_event_loop()
+
+        transport, protocol = await loop.subprocess_shell(
+            lambda: ExitProtocol(self.BUFFSIZE, loop),
+            command,
+            **kwargs)
+
+        return Process(transport, protocol, loop), protocol.exited
+
+    async def _create_process(self, command: str, kwargs: dict) -> tuple:
+        """
+        Create the process running ``command``. When cancelled during the
+        process creation, asyncio waits until the command has completed, so
+        we shield it and we kill the process instead.
+        :returns: (Process, asyncio.Event) tuple with the process and the
+            event which is set when process has exited
+        """
+        spawn = libkirk.create_task(self._spawn_process(command, kwargs))
+
+        try:
+            return await asyncio.shield(spawn)
+        except asyncio.CancelledError:
+            proc, _ = await spawn
+
+            self._kill_process(proc)
+            await proc.wait()
+
+            raise
+
+    async def _read_stdout(
+            self,
+            proc: Process,
+            iobuffer: IOBuffer = None) -> tuple:
+        """
+        Read process stdout until EOF.
+        :param proc: running process
+        :type proc: Process
+        :param iobuffer: buffer used to write stdout
+        :type iobuffer: IOBuffer
+        :returns: (str, bool) tuple with stdout and True if kernel panic
+            message has been found
+        """
+        panic = False
+        panic_tail = b""
+        stdout_buf = bytearray()
+        stdout_chunks = []
+
+        # multi-byte characters can be split between two reads, so
+        # iobuffer data is decoded incrementally
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+
+        while True:
+            line = await proc.stdout.read(self.BUFFSIZE)
+            if not line:
+                break
+
+            # when data is decoded for iobuffer, we reuse it for
+            # stdout, so we don't decode the same bytes twice
+            if iobuffer:
+                sline = decoder.decode(line)
+                if sline:
+                    stdout_chunks.append(sline)
+                    await iobuffer.write(sline)
+            else:
+                stdout_buf.extend(line)
+
+            # keep the last bytes of the previous chunk, so we can match
+            # the panic message when it's split between two reads
+            window = panic_tail + line
+            if self.PANIC_MSG in window:
+                panic = True
+
+            panic_tail = window[-(len(self.PANIC_MSG) - 1):]
+
+        if not iobuffer:
+            return stdout_buf.decode(encoding="utf-8", errors="ignore"), panic
+
+        sline = decoder.decode(b"", final=True)
+        if sline:
+            stdout_chunks.append(sline)
+            await iobuffer.write(sline)
+
+        return "".join(stdout_chunks), panic
+
     async def run_command(
             self,
             command: str,
@@ -154,25 +266,34 @@ class HostSUT(SUT):
                 # env usage if dictionary is empty
                 kwargs["env"] = env
 
-            proc = await asyncio.create_subprocess_shell(command, **kwargs)
+            proc, exited = await self._create_process(command, kwargs)
 
-            self._procs.append(proc)
+            self._procs.add(proc)
 
             t_start = time.time()
-            panic = False
 
-            while True:
-                line = await proc.stdout.read(self.BUFFSIZE)
-                sline = line.decode(encoding="utf-8", errors="ignore")
+            reader = libkirk.create_task(
+                self._read_stdout(proc, iobuffer=iobuffer))
+            # Process.wait() can't be used to know when process has exited,
+            # since on recent python versions it also waits for stdout to be
+            # closed
+            waiter = libkirk.create_task(exited.wait())
 
-                if iobuffer:
-                    await iobuffer.write(sline)
+            try:
+                await asyncio.wait(
+                    [reader, waiter],
+                    return_when=asyncio.FIRST_COMPLETED)
 
-                stdout += sline
-                panic = "Kernel panic" in stdout[-2*self.BUFFSIZE:]
+                if not reader.done():
+                    # process has been terminated, but background processes
+                    # still keep stdout open. We kill them, so we read the
+                    # remaining data until EOF
+                    self._kill_process(proc)
 
-                if not await self._process_alive(proc):
-                    break
+                stdout, panic = await reader
+            finally:
+                reader.cancel()
+                waiter.cancel()
 
             await proc.wait()
 
@@ -182,10 +303,13 @@ class HostSUT(SUT):
                 raise KernelPanicError()
         finally:
             if proc:
-                self._procs.remove(proc)
+                self._procs.discard(proc)
 
-                await self._kill_process(proc)
-                await proc.wait()
+                # process might be still running if command has been
+                # interrupted, otherwise it has been already collected
+                if proc.returncode is None:
+                    self._kill_process(proc)
+                    await proc.wait()
 
                 ret = {
                     "command": command,
@@ -210,17 +334,44 @@ class HostSUT(SUT):
         if not await self.is_running:
             raise SUTError("SUT is not running")
 
-        async with self._fetch_lock:
-            self._logger.info("Downloading '%s'", target_path)
+        # fetching different files can run concurrently, so we only
+        # serialize requests on the same file
+        path = os.path.realpath(target_path)
+        lock = self._fetch_locks.setdefault(path, asyncio.Lock())
+        self._fetch_users[path] = self._fetch_users.get(path, 0) + 1
 
-            retdata = bytes()
+        try:
+            async with lock:
+                return await self._read_file(target_path)
+        finally:
+            # drop the lock when nobody else is fetching the same file
+            self._fetch_users[path] -= 1
+            if self._fetch_users[path] == 0:
+                self._fetch_users.pop(path)
+                self._fetch_locks.pop(path)
 
-            try:
-                with open(target_path, 'rb') as ftarget:
-                    retdata = ftarget.read()
-            except IOError as err:
-                raise SUTError(err)
+    async def _read_file(self, target_path: str) -> bytes:
+        """
+        Read file from target path.
+        """
+        self._logger.info("Downloading '%s'", target_path)
 
-            self._logger.info("File copied")
+        retdata = bytearray()
 
-            return retdata
+        try:
+            with open(target_path, 'rb') as ftarget:
+                # read file in chunks inside a thread, so we don't block
+                # the event loop with huge files
+                while not self._stop:
+                    data = await libkirk.to_thread(
+                        ftarget.read, self.FETCH_BUFFSIZE)
+                    if not data:
+                        break
+
+                    retdata.extend(data)
+        except IOError as err:
+            raise SUTError(err)
+
+        self._logger.info("File copied")
+
+        return bytes(retdata)
@@ -8,7 +8,10 @@
 import os
 import re
 import json
+import asyncio
 import logging
+from collections import Counter
+import libkirk
 from libkirk.results import TestResults
 from libkirk.results import ResultStatus
 from libkirk.sut import SUT
@@ -23,7 +26,7 @@ class LTPFramework(Framework):
     Linux Test Project framework definition.
     """
 
-    PARALLEL_BLACKLIST = [
+    PARALLEL_BLACKLIST = frozenset([
         "needs_root",
         "needs_device",
         "mount_device",
@@ -32,7 +35,22 @@ class LTPFramework(Framework):
         "format_device",
         "save_restore",
         "max_runtime"
-    ]
+    ])
+
+    COLORS_RE = re.compile(r'\u001b\[[0-9;]+[a-zA-Z]')
+
+    SUMMARY_RE = re.compile(
+        r"Summary:\n"
+        r"passed\s*(?P<passed>\d+)\n"
+        r"failed\s*(?P<failed>\d+)\n"
+        r"broken\s*(?P<broken>\d+)\n"
+        r"skipped\s*(?P<skipped>\d+)\n"
+        r"warnings\s*(?P<warnings>\d+)\n"
+    )
+
+    SUMMARY_WINDOW = 4096
+
+    RESULTS_RE = re.compile(r"T(PASS|FAIL|SKIP|BROK|WARN)")
 
     def __init__(self) -> None:
         self._logger = logging.getLogger("libkirk.ltp")
@@ -124,15 +142,17 @@ class LTPFramework(Framework):
 
         return addable
 
+    # pylint: disable=too-many-statements
     # pylint: disable=too-many-locals
-    async def _read_runtest(
+    def _read_runtest(
             self,
-            sut: SUT,
             suite_name: str,
             content: str,
+            env: dict,
             metadata: dict = None) -> Suite:
         """
         It reads a runtest file content and it returns a Suite object.
+        This method is CPU bound, so it's meant to run inside a thread.
         """
         self._logger.info("collecting testing suite: %s", suite_name)
 
@@ -141,17 +161,20 @@ class LTPFramework(Framework):
             self._logger.info("Reading metadata content")
             metadata_tests = metadata.get("tests", None)
 
-        env = await self._read_path(sut)
-
         tests = []
-        lines = content.split('\n')
         tc_path = os.path.join(self._root, "testcases", "bin")
 
-        for line in lines:
-            if not line.strip() or line.strip().startswith("#"):
+        # logging level won't change while reading the file
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+        info_enabled = self._logger.isEnabledFor(logging.INFO)
+
+        for line in content.splitlines():
+            sline = line.strip()
+            if not sline or sline.startswith("#"):
                 continue
 
-            self._logger.debug("Test declaration: %s", line)
+            if debug_enabled:
+                self._logger.debug("Test declaration: %s", line)
 
             parts = line.split()
             if len(parts) < 2:
@@ -172,10 +195,12 @@ class LTPFramework(Framework):
                 parallelizable = False
             else:
                 test_params = metadata_tests.get(test_name, None)
-                if test_params:
+                if test_params and info_enabled:
                     self._logger.info(
                         "Found %s test params in metadata", test_name)
-                    self._logger.debug("params=%s", test_params)
+
+                    if debug_enabled:
+                        self._logger.debug("params=%s", test_params)
 
                 if test_params is None:
                     # this probably means test is not using new LTP API,
@@ -185,15 +210,16 @@ class LTPFramework(Framework):
                     if not self._is_addable(test_params):
                         continue
 
-                    for blacklist_param in self.PARALLEL_BLACKLIST:
-                        if blacklist_param in test_params:
-                            parallelizable = False
-                            break
+                    parallelizable = self.PARALLEL_BLACKLIST.isdisjoint(
+                        test_params)
 
-            if not parallelizable:
-                self._logger.info("Test '%s' is not parallelizable", test_name)
-            else:
-                self._logger.info("Test '%s' is parallelizable", test_name)
+            if info_enabled:
+                if not parallelizable:
+                    self._logger.info(
+                        "Test '%s' is not parallelizable", test_name)
+                else:
+                    self._logger.info(
+                        "Test '%s' is parallelizable", test_name)
 
             test = Test(
                 name=test_name,
@@ -205,7 +231,8 @@ class LTPFramework(Framework):
 
             tests.append(test)
 
-            self._logger.debug("test: %s", test)
+            if debug_enabled:
+                self._logger.debug("test: %s", test)
 
         self._logger.debug("Collected tests: %d", len(tests))
 
@@ -224,16 +251,21 @@ class LTPFramework(Framework):
         if not sut:
             raise ValueError("SUT is None")
 
-        ret = await sut.run_command(f"test -d {self._root}")
-        if ret["returncode"] != 0:
+        runtest_dir = os.path.join(self._root, "runtest")
+
+        # run independent checks at the same time
+        ret_root, ret_runtest, ret = await asyncio.gather(
+            sut.run_command(f"test -d {self._root}"),
+            sut.run_command(f"test -d {runtest_dir}"),
+            sut.run_command(f"ls --format=single-column {runtest_dir}"),
+        )
+
+        if ret_root["returncode"] != 0:
             raise FrameworkError(f"LTP folder doesn't exist: {self._root}")
 
-        runtest_dir = os.path.join(self._root, "runtest")
-        ret = await sut.run_command(f"test -d {runtest_dir}")
-        if ret["returncode"] != 0:
+        if ret_runtest["returncode"] != 0:
             raise FrameworkError(f"'{runtest_dir}' doesn't exist inside SUT")
 
-        ret = await sut.run_command(f"ls --format=single-column {runtest_dir}")
         stdout = ret["stdout"]
         if ret["returncode"] != 0:
             raise FrameworkError(f"command failed with: {stdout}")
@@ -248,31 +280,45 @@ class LTPFramework(Framework):
         if not name:
             raise ValueError("name is empty")
 
-        ret = await sut.run_command(f"test -d {self._root}")
-        if ret["returncode"] != 0:
-            raise FrameworkError(f"LTP folder doesn't exist: {self._root}")
-
         suite_path = os.path.join(self._root, "runtest", name)
-
-        ret = await sut.run_command(f"test -f {suite_path}")
-        if ret["returncode"] != 0:
-            raise FrameworkError(f"'{name}' suite doesn't exist")
-
-        runtest_data = await sut.fetch_file(suite_path)
-        runtest_str = runtest_data.decode(encoding="utf-8", errors="ignore")
-
         metadata_path = os.path.join(
             self._root,
             "metadata",
             "ltp.json"
         )
+
+        # run independent checks at the same time
+        ret_root, ret_suite, ret_metadata = await asyncio.gather(
+            sut.run_command(f"test -d {self._root}"),
+            sut.run_command(f"test -f {suite_path}"),
+            sut.run_command(f"test -f {metadata_path}"),
+        )
+
+        if ret_root["returncode"] != 0:
+            raise FrameworkError(f"LTP folder doesn't exist: {self._root}")
+
+        if ret_suite["returncode"] != 0:
+            raise FrameworkError(f"'{name}' suite doesn't exist")
+
+        # fetch_file and run_command might share the same channel with the
+        # SUT, so we don't run them at the same time
+        runtest_data = await sut.fetch_file(suite_path)
+
         metadata_dict = None
-        ret = await sut.run_command(f"test -f {metadata_path}")
-        if ret["returncode"] == 0:
+        if ret_metadata["returncode"] == 0:
             metadata_data = await sut.fetch_file(metadata_path)
             metadata_dict = json.loads(metadata_data)
 
-        suite = await self._read_runtest(sut, name, runtest_str, metadata_dict)
+        env = await self._read_path(sut)
+
+        runtest_str = runtest_data.decode(encoding="utf-8", errors="ignore")
+
+        suite = await libkirk.to_thread(
+            self._read_runtest,
+            name,
+            runtest_str,
+            env,
+            metadata_dict)
 
         return suite
 
@@ -283,23 +329,18 @@ class LTPFramework(Framework):
             retcode: int,
             exec_t: float) -> TestResults:
         # get rid of colors from stdout
-        stdout = re.sub(r'\u001b\[[0-9;]+[a-zA-Z]', '', stdout)
-
-        match = re.search(
-            r"Summary:\n"
-            r"passed\s*(?P<passed>\d+)\n"
-            r"failed\s*(?P<failed>\d+)\n"
-            r"broken\s*(?P<broken>\d+)\n"
-            r"skipped\s*(?P<skipped>\d+)\n"
-            r"warnings\s*(?P<warnings>\d+)\n",
-            stdout
-        )
+        stdout = self.COLORS_RE.sub('', stdout)
+
+        # LTP summary is printed at the end of the test, so we first look
+        # for it inside the last part of stdout
+        match = self.SUMMARY_RE.search(stdout[-self.SUMMARY_WINDOW:])
+        if not match and len(stdout) > self.SUMMARY_WINDOW:
+            match = self.SUMMARY_RE.search(stdout)
 
         passed = 0
         failed = 0
         skipped = 0
         broken = 0
-        skipped = 0
         warnings = 0
         error = retcode == -1
         status = ResultStatus.PASS
@@ -309,14 +350,16 @@ class LTPFramework(Framework):
             failed = int(match.group("failed"))
             skipped = int(match.group("skipped"))
             broken = int(match.group("broken"))
-            skipped = int(match.group("skipped"))
             warnings = int(match.group("warnings"))
         else:
-            passed = stdout.count("TPASS")
-            failed = stdout.count("TFAIL")
-            skipped = stdout.count("TSKIP")
-            broken = stdout.count("TBROK")
-            warnings = stdout.count("TWARN")
+            # count all results in a single pass over stdout
+            tags = Counter(self.RESULTS_RE.findall(stdout))
+
+            passed = tags["PASS"]
+            failed = tags["FAIL"]
+            skipped = tags["SKIP"]
+            broken = tags["BROK"]
+            warnings = tags["WARN"]
 
             if passed == 0 and \
                     failed == 0 and \
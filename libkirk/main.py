@@ -312,6 +312,7 @@ def _start_session(
             await libkirk.events.stop()
 
     loop = libkirk.get_event_loop()
+    libkirk.set_eager_tasks(loop)
 
     try:
         loop.run_until_complete(
@@ -339,6 +340,8 @@ def run(cmd_args: list = None) -> None:
     """
     Entry point of the application.
     """
+    libkirk.install_uvloop()
+
     currdir = os.path.dirname(os.path.realpath(__file__))
     _discover_sut(currdir)
     _discover_frameworks(currdir)
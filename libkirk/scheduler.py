@@ -9,6 +9,7 @@ import os
 import re
 import sys
 import time
+import shlex
 import asyncio
 import logging
 import libkirk
@@ -64,32 +65,111 @@ class Scheduler:
         raise NotImplementedError()
 
 
-class RedirectTestStdout(IOBuffer):
+class RedirectStdout(IOBuffer):
+    """
+    Redirect stdout data to UI events. Data is collected and the event is
+    fired when enough data is available or after a small delay, so we don't
+    fire an event for each written chunk.
+    """
+    EVENT_SIZE = 4096
+    EVENT_DELAY = 0.05
+
+    def __init__(self, event_name: str) -> None:
+        self._event_name = event_name
+        self._pending = []
+        self._pending_size = 0
+        self._last_fire = time.monotonic()
+        self._flush_task = None
+
+    async def _fire(self, data: str) -> None:
+        """
+        Fire the event with the given data.
+        """
+        raise NotImplementedError()
+
+    async def write(self, data: str) -> None:
+        # avoid collecting data when nobody is listening
+        if not libkirk.events.is_registered(self._event_name):
+            return
+
+        self._pending.append(data)
+        self._pending_size += len(data)
+
+        if self._pending_size >= self.EVENT_SIZE or \
+                time.monotonic() - self._last_fire >= self.EVENT_DELAY:
+            await self.flush()
+        elif not self._flush_task:
+            # data must be fired even if nothing else is written after it
+            self._flush_task = libkirk.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        """
+        Flush pending data after the event delay.
+        """
+        await asyncio.sleep(self.EVENT_DELAY)
+
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        if not self._pending:
+            return
+
+        data = "".join(self._pending)
+
+        self._pending.clear()
+        self._pending_size = 0
+        self._last_fire = time.monotonic()
+
+        await self._fire(data)
+
+
+class RedirectTestStdout(RedirectStdout):
     """
     Redirect test stdout data to UI events and save it.
     """
 
     def __init__(self, test: Test) -> None:
-        self.stdout = ""
+        super().__init__("test_stdout")
+
+        self._chunks = []
         self._test = test
 
-    async def write(self, data: str) -> None:
+    @property
+    def stdout(self) -> str:
+        """
+        Test stdout data written so far.
+        """
+        return "".join(self._chunks)
+
+    async def _fire(self, data: str) -> None:
         await libkirk.events.fire("test_stdout", self._test, data)
-        self.stdout += data
+
+    async def write(self, data: str) -> None:
+        self._chunks.append(data)
+
+        await super().write(data)
 
 
-class RedirectSUTStdout(IOBuffer):
+class RedirectSUTStdout(RedirectStdout):
     """
     Redirect SUT stdout data to UI events.
     """
 
     def __init__(self, sut: SUT) -> None:
+        super().__init__("sut_stdout")
+
         self._sut = sut
 
-    async def write(self, data: str) -> None:
+    async def _fire(self, data: str) -> None:
         await libkirk.events.fire("sut_stdout", self._sut.name, data)
 
 
+# pylint: disable=too-many-instance-attributes
 class TestScheduler(Scheduler):
     """
     Schedule and run tests, taking into account status of the kernel
@@ -121,9 +201,13 @@ class TestScheduler(Scheduler):
         self._max_workers = kwargs.get("max_workers", 1)
         self._force_parallel = kwargs.get("force_parallel", False)
         self._lock = asyncio.Lock()
+        self._done = asyncio.Event()
+        self._done.set()
         self._results = []
         self._stop = False
         self._tasks = []
+        self._last_tainted = None
+        self._is_root = None
 
         if not self._sut:
             raise ValueError("SUT object is empty")
@@ -160,13 +244,17 @@ class TestScheduler(Scheduler):
         """
         If root, we write test information on /dev/kmsg.
         """
-        self._logger.info("Writing test information on /dev/kmsg")
+        # user won't change during the same schedule, so we check it once
+        if self._is_root is None:
+            ret = await self._sut.run_command("id -u")
+            self._is_root = ret["stdout"] == "0\n"
 
-        ret = await self._sut.run_command("id -u")
-        if ret["stdout"] != "0\n":
+        if not self._is_root:
             self._logger.info("Can't write on /dev/kmsg from user")
             return
 
+        self._logger.info("Writing test information on /dev/kmsg")
+
         cmd = f"{test.command}"
         if len(test.arguments) > 0:
             cmd += ' '
@@ -175,7 +263,8 @@ class TestScheduler(Scheduler):
         message = f'{sys.argv[0]}[{os.getpid()}]: ' \
             f'starting test {test.name} ({cmd})\n'
 
-        await self._sut.run_command(f'echo -n "{message}" > /dev/kmsg')
+        await self._sut.run_command(
+            f'printf %s {shlex.quote(message)} > /dev/kmsg')
 
     @ property
     def results(self) -> list:
@@ -189,15 +278,14 @@ class TestScheduler(Scheduler):
 
         self._stop = True
         try:
+            # cancel() does nothing on tasks which are already done
             for task in self._tasks:
-                if not task.cancelled():
-                    task.cancel()
+                task.cancel()
 
             # wait until all tasks have been cancelled
             await asyncio.gather(*self._tasks, return_exceptions=True)
 
-            async with self._lock:
-                pass
+            await self._done.wait()
         finally:
             self._stop = False
 
@@ -228,17 +316,26 @@ class TestScheduler(Scheduler):
             status = self.STATUS_OK
 
             try:
-                tainted_code1, _ = await self._get_tainted_status()
+                # tainted status read after the last test is still valid,
+                # so we don't need to read it again
+                tainted_code1 = self._last_tainted
+                if tainted_code1 is None:
+                    tainted_code1, _ = await self._get_tainted_status()
 
-                test_data = await asyncio.wait_for(self._sut.run_command(
-                    cmd,
-                    cwd=test.cwd,
-                    env=test.env,
-                    iobuffer=iobuffer),
-                    timeout=self._timeout
-                )
+                try:
+                    test_data = await asyncio.wait_for(self._sut.run_command(
+                        cmd,
+                        cwd=test.cwd,
+                        env=test.env,
+                        iobuffer=iobuffer),
+                        timeout=self._timeout
+                    )
+                finally:
+                    await iobuffer.flush()
 
                 tainted_code2, tainted_msg2 = await self._get_tainted_status()
+                self._last_tainted = tainted_code2
+
                 if tainted_code2 != tainted_code1:
                     self._logger.info(
                         "Recognised Kernel tainted: %s",
@@ -247,11 +344,15 @@ class TestScheduler(Scheduler):
                     tainted_msg = tainted_msg2
                     status = self.KERNEL_TAINED
             except libkirk.sut.KernelPanicError:
+                # tainted status has not been read after the test
+                self._last_tainted = None
                 exec_time = time.time() - start_t
 
                 self._logger.info("Recognised Kernel panic")
                 status = self.KERNEL_PANIC
             except asyncio.TimeoutError:
+                # tainted status has not been read after the test
+                self._last_tainted = None
                 exec_time = time.time() - start_t
                 status = self.TEST_TIMEOUT
 
@@ -317,11 +418,15 @@ class TestScheduler(Scheduler):
 
         self._logger.info("Scheduling %d tests on single worker", len(tests))
 
-        for test in tests:
-            task = libkirk.create_task(self._run_test(test, sem))
-            self._tasks.append(task)
+        async def _run_tests() -> None:
+            for test in tests:
+                await self._run_test(test, sem)
+
+        # a single task runs all tests, so stop() can still cancel it
+        task = libkirk.create_task(_run_tests())
+        self._tasks.append(task)
 
-            await task
+        await task
 
     async def _run_parallel(self, tests: list) -> None:
         """
@@ -331,7 +436,9 @@ class TestScheduler(Scheduler):
             return
 
         sem = asyncio.Semaphore(self._max_workers)
-        tasks = [asyncio.Task(self._run_test(test, sem)) for test in tests]
+        tasks = [
+            libkirk.create_task(self._run_test(test, sem)) for test in tests
+        ]
 
         self._logger.info(
             "Scheduling %d tests on %d workers",
@@ -339,7 +446,32 @@ class TestScheduler(Scheduler):
             self._max_workers)
 
         self._tasks.extend(tasks)
-        await asyncio.gather(*tasks)
+
+        try:
+            # stop as soon as one test raises a kernel error, so the
+            # other tests don't keep running on a broken SUT
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            if pending:
+                self._logger.info("Cancelling %d tasks", len(pending))
+
+                for task in pending:
+                    task.cancel()
+
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        # retrieve all exceptions, so they are not reported as unhandled,
+        # then raise the first one
+        errors = [
+            task.exception() for task in tasks if not task.cancelled()
+        ]
+        errors = [err for err in errors if err]
+        if errors:
+            raise errors[0]
+
+        if any(task.cancelled() for task in tasks):
+            raise asyncio.CancelledError()
 
     async def schedule(self, jobs: list) -> None:
         if not jobs:
@@ -352,9 +484,14 @@ class TestScheduler(Scheduler):
         async with self._lock:
             self._logger.info("Check what tests can be run in parallel")
 
+            self._done.clear()
             self._tasks.clear()
             self._results.clear()
 
+            # SUT might have been restarted since last schedule
+            self._last_tainted = None
+            self._is_root = None
+
             try:
                 if self._force_parallel:
                     await self._run_parallel(jobs)
@@ -366,21 +503,9 @@ class TestScheduler(Scheduler):
                         test for test in jobs if not test.parallelizable
                     ])
             except KirkException as err:
-                self._logger.info(
-                    "%s caught. Cancel tasks",
-                    err.__class__.__name__)
-
+                self._logger.info("%s caught", err.__class__.__name__)
                 self._logger.error(err)
 
-                for task in self._tasks:
-                    self._logger.info("Cancelling %d tasks", len(self._tasks))
-
-                    if not task.done() and not task.cancelled():
-                        task.cancel()
-
-                self._logger.info("Wait for tasks to be done")
-                await asyncio.gather(*self._tasks, return_exceptions=True)
-
                 if not self._stop:
                     raise err
             except asyncio.CancelledError as err:
@@ -388,6 +513,7 @@ class TestScheduler(Scheduler):
                     raise err
             finally:
                 self._tasks.clear()
+                self._done.set()
 
 
 class SuiteScheduler(Scheduler):
@@ -423,6 +549,8 @@ class SuiteScheduler(Scheduler):
         self._results = []
         self._stop = False
         self._lock = asyncio.Lock()
+        self._done = asyncio.Event()
+        self._done.set()
 
         if not self._sut:
             raise ValueError("SUT is an empty object")
@@ -454,8 +582,7 @@ class SuiteScheduler(Scheduler):
         try:
             await self._scheduler.stop()
 
-            async with self._lock:
-                pass
+            await self._done.wait()
         finally:
             self._stop = False
 
@@ -472,8 +599,12 @@ class SuiteScheduler(Scheduler):
         iobuffer = RedirectSUTStdout(self._sut)
 
         await self._scheduler.stop()
-        await self._sut.stop(iobuffer=iobuffer)
-        await self._sut.ensure_communicate(iobuffer=iobuffer)
+
+        try:
+            await self._sut.stop(iobuffer=iobuffer)
+            await self._sut.ensure_communicate(iobuffer=iobuffer)
+        finally:
+            await iobuffer.flush()
 
         self._logger.info("SUT rebooted")
 
@@ -534,33 +665,25 @@ class SuiteScheduler(Scheduler):
 
                 # tests_left array will be populated when SUT is
                 # rebooted after a kernel error
-                tests_left.clear()
-
-                for test in tests:
-                    found = False
-                    for test_res in tests_results:
-                        if test.name == test_res.test.name:
-                            found = True
-                            break
-
-                    if not found:
-                        tests_left.append(test)
+                done_names = {res.test.name for res in tests_results}
+                tests_left[:] = [
+                    test for test in tests if test.name not in done_names
+                ]
 
                 if timed_out:
-                    for test in tests_left:
-                        tests_results.append(
-                            TestResults(
-                                test=test,
-                                failed=0,
-                                passed=0,
-                                broken=0,
-                                skipped=1,
-                                warnings=0,
-                                exec_time=0.0,
-                                retcode=32,
-                                stdout=""
-                            )
-                        )
+                    tests_results.extend(
+                        TestResults(
+                            test=test,
+                            failed=0,
+                            passed=0,
+                            broken=0,
+                            skipped=1,
+                            warnings=0,
+                            exec_time=0.0,
+                            retcode=32,
+                            stdout=""
+                        ) for test in tests_left
+                    )
 
                     # no more tests need to be run
                     tests_left.clear()
@@ -600,7 +723,11 @@ class SuiteScheduler(Scheduler):
                 raise ValueError("jobs must be a list of Suite")
 
         async with self._lock:
+            self._done.clear()
             self._results.clear()
 
-            for suite in jobs:
-                await libkirk.create_task(self._run_suite(suite))
+            try:
+                for suite in jobs:
+                    await libkirk.create_task(self._run_suite(suite))
+            finally:
+                self._done.set()
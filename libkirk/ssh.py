@@ -6,10 +6,10 @@
 .. moduleauthor:: Andrea Cervesato <andrea.cervesato@suse.com>
 """
 import time
+import shlex
 import asyncio
 import logging
 import importlib
-import contextlib
 from libkirk.sut import SUT
 from libkirk.sut import SUTError
 from libkirk.sut import IOBuffer
@@ -75,18 +75,17 @@ class SSHSUT(SUT):
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE)
 
+        # reset command is expected to close stdout when it completes, so we
+        # read until EOF. Background processes inheriting stdout would make
+        # this wait for them as well
         while True:
             line = await proc.stdout.read(1024)
-            if line:
-                sline = line.decode(encoding="utf-8", errors="ignore")
-
-                if iobuffer:
-                    await iobuffer.write(sline)
+            if not line:
+                break
 
-            with contextlib.suppress(asyncio.TimeoutError):
-                returncode = await asyncio.wait_for(proc.wait(), 1e-6)
-                if returncode is not None:
-                    break
+            if iobuffer:
+                sline = line.decode(encoding="utf-8", errors="ignore")
+                await iobuffer.write(sline)
 
         await proc.wait()
 
@@ -109,7 +108,7 @@ class SSHSUT(SUT):
 
         script = ''.join(args)
         if self._sudo:
-            script = f"sudo /bin/sh -c '{script}'"
+            script = f"sudo /bin/sh -c {shlex.quote(script)}"
 
         return script
 
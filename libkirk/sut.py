@@ -7,6 +7,8 @@
 """
 import re
 import asyncio
+import functools
+import libkirk
 from libkirk import KirkException
 from libkirk.plugin import Plugin
 
@@ -34,6 +36,11 @@ class IOBuffer:
         """
         raise NotImplementedError()
 
+    async def flush(self) -> None:
+        """
+        Flush buffered data, if any.
+        """
+
 
 TAINED_MSG = [
     "proprietary module was loaded",
@@ -56,6 +63,65 @@ TAINED_MSG = [
     "kernel was built with the struct randomization plugin"
 ]
 
+INFO_MARKER = "__kirk_info__:"
+
+_MEM_RE = re.compile(r'MemTotal:\s+(?P<memory>\d+\s+kB)')
+
+_SWAP_RE = re.compile(r'SwapTotal:\s+(?P<swap>\d+\s+kB)')
+
+
+def _parse_info(stdout: str) -> dict:
+    """
+    Parse the output of the SUT information command. Commands which
+    failed or didn't print anything are not included.
+    :param stdout: output of the SUT information command
+    :type stdout: str
+    :returns: dict
+    """
+    data = {}
+    key = None
+    lines = []
+
+    for line in stdout.splitlines():
+        if not line.startswith(INFO_MARKER):
+            lines.append(line)
+            continue
+
+        name = line[len(INFO_MARKER):]
+        if name.startswith("rc:"):
+            value = "\n".join(lines).rstrip()
+            if key and name == "rc:0" and value:
+                data[key] = value
+
+            key = None
+        else:
+            key = name
+
+        lines = []
+
+    return data
+
+
+@functools.lru_cache(maxsize=128)
+def _decode_tainted(code: int) -> tuple:
+    """
+    Return the messages associated with the tainted ``code`` bits. Kernel
+    tainted code is usually zero or it has a few values during a session,
+    so decoded messages are cached.
+    """
+    messages = []
+
+    # iterate only over the bits which are set, starting from the lowest
+    while code:
+        lowest = code & -code
+        index = lowest.bit_length() - 1
+        if index < len(TAINED_MSG):
+            messages.append(TAINED_MSG[index])
+
+        code ^= lowest
+
+    return tuple(messages)
+
 
 class SUT(Plugin):
     """
@@ -63,6 +129,11 @@ class SUT(Plugin):
     machine instance, etc.
     """
 
+    # tainted kernel information read which is in progress and the number
+    # of callers waiting for it
+    _tainted_task = None
+    _tainted_waiters = 0
+
     @property
     def parallel_execution(self) -> bool:
         """
@@ -180,91 +251,99 @@ class SUT(Plugin):
             }
 
         """
-        # create suite results
-        async def _run_cmd(cmd: str) -> str:
-            """
-            Run command, check for returncode and return command's stdout.
-            """
-            stdout = "unknown"
-            try:
-                ret = await asyncio.wait_for(self.run_command(cmd), 1.5)
-                if ret["returncode"] == 0:
-                    stdout = ret["stdout"].rstrip()
-            except asyncio.TimeoutError:
-                pass
-
-            return stdout
-
-        distro, \
-            distro_ver, \
-            kernel, \
-            arch, \
-            cpu, \
-            meminfo = await asyncio.gather(*[
-                _run_cmd(". /etc/os-release && echo \"$ID\""),
-                _run_cmd(". /etc/os-release && echo \"$VERSION_ID\""),
-                _run_cmd("uname -s -r -v"),
-                _run_cmd("uname -m"),
-                _run_cmd("uname -p"),
-                _run_cmd("cat /proc/meminfo")
-            ])
+        # all information is read with a single command, in order to reduce
+        # the number of round-trips with the SUT. Each command output is
+        # preceded by a marker line and followed by its exit status, that we
+        # use to split stdout
+        commands = [
+            ("distro", "(. /etc/os-release && echo \"$ID\")"),
+            ("distro_ver", "(. /etc/os-release && echo \"$VERSION_ID\")"),
+            ("kernel", "uname -s -r -v"),
+            ("arch", "uname -m"),
+            ("cpu", "uname -p"),
+            ("meminfo", "cat /proc/meminfo"),
+        ]
+
+        cmd = "; ".join(
+            f"echo '{INFO_MARKER}{key}'; {item}; echo \"{INFO_MARKER}rc:$?\""
+            for key, item in commands)
+
+        data = {}
+        try:
+            ret = await asyncio.wait_for(self.run_command(cmd), 5)
+            data = _parse_info(ret["stdout"])
+        except asyncio.TimeoutError:
+            pass
 
         memory = "unknown"
         swap = "unkown"
 
+        meminfo = data.get("meminfo", None)
         if meminfo:
-            mem_m = re.search(r'MemTotal:\s+(?P<memory>\d+\s+kB)', meminfo)
+            mem_m = _MEM_RE.search(meminfo)
             if mem_m:
                 memory = mem_m.group('memory')
 
-            swap_m = re.search(r'SwapTotal:\s+(?P<swap>\d+\s+kB)', meminfo)
+            swap_m = _SWAP_RE.search(meminfo)
             if swap_m:
                 swap = swap_m.group('swap')
 
         ret = {
-            "distro": distro,
-            "distro_ver": distro_ver,
-            "kernel": kernel,
-            "arch": arch,
-            "cpu": cpu,
+            "distro": data.get("distro", "unknown"),
+            "distro_ver": data.get("distro_ver", "unknown"),
+            "kernel": data.get("kernel", "unknown"),
+            "arch": data.get("arch", "unknown"),
+            "cpu": data.get("cpu", "unknown"),
             "ram": memory,
             "swap": swap
         }
 
         return ret
 
-    _tainted_lock = asyncio.Lock()
-    _tainted_status = asyncio.Queue(maxsize=1)
-
-    async def get_tainted_info(self) -> tuple:
+    async def _read_tainted_info(self) -> tuple:
         """
-        Return information about kernel if tainted.
-        :returns: (int, list[str])
+        Read tainted kernel information from SUT.
+        :returns: (int, tuple[str])
         """
-        if self._tainted_lock.locked() and self._tainted_status.qsize() > 0:
-            status = await self._tainted_status.get()
-            return status
-
-        async with self._tainted_lock:
-            ret = await self.run_command("cat /proc/sys/kernel/tainted")
-            if ret["returncode"] != 0:
-                raise SUTError("Can't read tainted kernel information")
-
-            stdout = ret["stdout"].rstrip()
+        ret = await self.run_command("cat /proc/sys/kernel/tainted")
+        if ret["returncode"] != 0:
+            raise SUTError("Can't read tainted kernel information")
 
-            tainted_num = len(TAINED_MSG)
-            code = int(stdout.rstrip())
-            bits = format(code, f"0{tainted_num}b")[::-1]
+        stdout = ret["stdout"].rstrip()
 
-            messages = []
-            for i in range(0, tainted_num):
-                if bits[i] == "1":
-                    msg = TAINED_MSG[i]
-                    messages.append(msg)
+        code = int(stdout.rstrip())
+        messages = _decode_tainted(code)
 
-            if self._tainted_status.qsize() > 0:
-                await self._tainted_status.get()
+        return code, messages
 
-            await self._tainted_status.put((code, messages))
-
-            return code, messages
+    async def get_tainted_info(self) -> tuple:
+        """
+        Return information about kernel if tainted.
+        :returns: (int, list[str])
+        """
+        # tests running in parallel share the same read when it's in
+        # progress, instead of sending one command each to the SUT
+        if not self._tainted_task or self._tainted_task.done():
+            self._tainted_task = libkirk.create_task(
+                self._read_tainted_info())
+
+            # read errors must be retrieved, even if nobody is waiting
+            self._tainted_task.add_done_callback(
+                lambda task: task.cancelled() or task.exception())
+
+        task = self._tainted_task
+        self._tainted_waiters += 1
+
+        try:
+            # shield the read, so one caller's cancellation won't affect
+            # the others
+            code, messages = await asyncio.shield(task)
+        finally:
+            self._tainted_waiters -= 1
+
+            # nobody is waiting for the read anymore, so we don't leave it
+            # running on the SUT
+            if not task.done() and self._tainted_waiters == 0:
+                task.cancel()
+
+        return code, list(messages)
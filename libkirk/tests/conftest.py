@@ -1,6 +1,7 @@
 """
 Generic stuff for pytest.
 """
+import asyncio
 import libkirk
 import pytest
 from libkirk.results import TestResults
@@ -9,6 +10,11 @@ from libkirk.framework import Framework
 from libkirk.data import Suite
 from libkirk.data import Test
 
+try:
+    import uvloop
+except ModuleNotFoundError:
+    uvloop = None
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -25,6 +31,19 @@ def event_loop():
         loop.close()
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """
+    Event loop used by pytest-asyncio. Host SUT tests run many short
+    commands, so they use uvloop when it's available, in order to reduce
+    the event loop overhead.
+    """
+    if uvloop and item.module.__name__ == "libkirk.tests.test_host":
+        return {"uvloop": uvloop.new_event_loop}
+
+    return {"asyncio": asyncio.new_event_loop}
+
+
 class DummyFramework(Framework):
     """
     A generic framework created for testing.
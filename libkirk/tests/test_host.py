@@ -1,7 +1,11 @@
 """
 Unittests for host SUT implementations.
 """
+import asyncio
 import pytest
+import libkirk
+from libkirk.sut import IOBuffer
+from libkirk.sut import KernelPanicError
 from libkirk.host import HostSUT
 from libkirk.tests.test_sut import _TestSUT
 from libkirk.tests.test_session import _TestSession
@@ -17,8 +21,8 @@ async def sut():
 
     yield sut
 
-    if await sut.is_running:
-        await sut.stop()
+    # stop() does nothing if SUT is not running
+    await sut.stop()
 
 
 class TestHostSUT(_TestSUT):
@@ -26,15 +30,122 @@ class TestHostSUT(_TestSUT):
     Test HostSUT implementation.
     """
 
-    @pytest.fixture
-    def sut_stop_sleep(self, request):
+    # host SUT test doesn't require time sleep in `test_communicate_stop`
+    SUT_STOP_SLEEP_PARAMS = [0]
+
+    async def test_run_command_multibyte(self, sut):
+        """
+        Test run_command when multi-byte characters are split between
+        different reads.
+        """
+        class Buffer(IOBuffer):
+            """
+            Store stdout data.
+            """
+
+            def __init__(self) -> None:
+                self.data = ""
+
+            async def write(self, data: str) -> None:
+                self.data += data
+
+        sut.BUFFSIZE = 1
+        iobuffer = Buffer()
+
+        await sut.communicate()
+        ret = await sut.run_command("echo -n 'àèìòù'", iobuffer=iobuffer)
+
+        assert ret["returncode"] == 0
+        assert ret["stdout"] == "àèìòù"
+        assert iobuffer.data == "àèìòù"
+
+    async def test_run_command_background(self, sut):
         """
-        Host SUT test doesn't require time sleep in `test_stop_communicate`.
+        Test run_command when a background process keeps stdout open after
+        the command has completed.
         """
-        return request.param * 0
+        await sut.communicate()
+
+        ret = await sut.run_command("sleep 3 & echo -n ciao")
+
+        assert ret["returncode"] == 0
+        assert ret["stdout"] == "ciao"
+        assert ret["exec_time"] < 2
+
+    async def test_run_command_panic_split(self, sut):
+        """
+        Test run_command when kernel panic message is split between
+        different reads.
+        """
+        sut.BUFFSIZE = 4
+
+        await sut.communicate()
+
+        with pytest.raises(KernelPanicError):
+            await sut.run_command("echo -n 'xxKernel panic'")
+
+    async def test_fetch_file_parallel(self, sut, tmpdir, monkeypatch):
+        """
+        Test if different files are fetched in parallel.
+        """
+        reads = []
+        to_thread = libkirk.to_thread
+
+        def _to_thread(callback, *args):
+            reads.append(callback.__self__.name)
+            return to_thread(callback, *args)
+
+        monkeypatch.setattr(libkirk, "to_thread", _to_thread)
+
+        files = []
+        for i in range(2):
+            myfile = tmpdir / f"myfile{i}"
+            myfile.write("a" * 64)
+            files.append(str(myfile))
+
+        sut.FETCH_BUFFSIZE = 4
+
+        await sut.communicate()
+        data = await asyncio.gather(*[
+            sut.fetch_file(myfile) for myfile in files
+        ])
+
+        assert data == [b"a" * 64] * 2
+
+        # second file is read before the first file has been completed
+        first_read = reads.index(files[1])
+        last_read = len(reads) - 1 - reads[::-1].index(files[0])
+        assert first_read < last_read
+        assert not sut._fetch_locks
+
+    async def test_get_info_stderr(self, sut):
+        """
+        Test get_info when stderr is redirected to stdout and some
+        information can't be read.
+        """
+        run_command = sut.run_command
+
+        async def _run_command(command, cwd=None, env=None, iobuffer=None):
+            command = command.replace(
+                "/etc/os-release",
+                "/this_file_doesnt_exist")
+
+            return await run_command(
+                f"({command}) 2>&1",
+                cwd=cwd,
+                env=env,
+                iobuffer=iobuffer)
+
+        sut.run_command = _run_command
+
+        await sut.communicate()
+        info = await sut.get_info()
 
-    async def test_fetch_file_stop(self):
-        pytest.skip(reason="Coroutines don't support I/O file handling")
+        assert info["distro"] == "unknown"
+        assert info["distro_ver"] == "unknown"
+        assert info["kernel"] != "unknown"
+        assert info["arch"] != "unknown"
+        assert info["ram"] != "unknown"
 
 
 class TestHostSession(_TestSession):
@@ -202,3 +202,21 @@ class TestLTPFramework:
         assert result.test == test
         assert result.return_code == 32
         assert result.stdout == "mydata"
+
+    async def test_read_result_no_summary(self, framework):
+        """
+        Test read_result method when test doesn't print summary.
+        """
+        stdout = "TPASS: a\nTPASS: b\nTFAIL: c\nTBROK: d\nTSKIP: e\nTWARN: f\n"
+
+        test = Test(name="test", cmd="echo")
+        result = await framework.read_result(test, stdout, 1, 0.1)
+        assert result.passed == 2
+        assert result.failed == 1
+        assert result.broken == 1
+        assert result.skipped == 1
+        assert result.warnings == 1
+        assert result.exec_time == 0.1
+        assert result.test == test
+        assert result.return_code == 1
+        assert result.stdout == stdout
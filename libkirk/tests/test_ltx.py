@@ -301,8 +301,9 @@ class TestLTXSUT(_TestSUT):
     Test HostSUT implementation.
     """
 
+    @pytest.mark.skip(reason="LTX doesn't support stop for GET_FILE")
     async def test_fetch_file_stop(self):
-        pytest.skip(reason="LTX doesn't support stop for GET_FILE")
+        pass
 
 
 class TestLTXSession(_TestSession):
@@ -51,8 +51,9 @@ class _TestQemuSUT(_TestSUT):
                 "cat /tmp/panic.txt",
                 iobuffer=iobuff)
 
+    @pytest.mark.skip(reason="Coroutines don't support I/O file handling")
     async def test_fetch_file_stop(self):
-        pytest.skip(reason="Coroutines don't support I/O file handling")
+        pass
 
 
 @pytest.fixture
@@ -1,13 +1,18 @@
 """
 Unittests for runner module.
 """
+import os
 import re
+import sys
 import asyncio
 import pytest
+import libkirk
 from libkirk.sut import TAINED_MSG
 from libkirk.data import Test
 from libkirk.data import Suite
 from libkirk.host import HostSUT
+from libkirk.ssh import SSHSUT
+from libkirk.scheduler import RedirectStdout
 from libkirk.scheduler import TestScheduler
 from libkirk.scheduler import SuiteScheduler
 from libkirk.scheduler import KernelTainedError
@@ -88,6 +93,46 @@ async def sut():
     await obj.stop()
 
 
+async def test_redirect_stdout_delayed():
+    """
+    Test if RedirectStdout fires buffered data after the event delay,
+    even if nothing else is written.
+    """
+    class Redirect(RedirectStdout):
+        """
+        Store fired data.
+        """
+
+        def __init__(self) -> None:
+            super().__init__("myevent")
+            self.fired = []
+
+        async def _fire(self, data: str) -> None:
+            self.fired.append(data)
+
+    async def funct():
+        pass
+
+    libkirk.events.register("myevent", funct)
+
+    try:
+        redirect = Redirect()
+        await redirect.write("header\n")
+        await redirect.write("message\n")
+
+        assert redirect.fired == []
+
+        await asyncio.sleep(redirect.EVENT_DELAY * 4)
+
+        assert redirect.fired == ["header\nmessage\n"]
+
+        await redirect.flush()
+
+        assert redirect.fired == ["header\nmessage\n"]
+    finally:
+        libkirk.events.unregister("myevent")
+
+
 class TestTestScheduler:
     """
     Tests for TestScheduler.
@@ -196,6 +241,121 @@ class TestTestScheduler:
         with pytest.raises(KernelTainedError):
             await runner.schedule(tests)
 
+    async def test_schedule_tainted_reads(self, create_runner):
+        """
+        Test that tainted status is read once before the first test and
+        then only after each test.
+        """
+        reads = []
+
+        async def mock_tainted():
+            reads.append(1)
+            return 0, [""]
+
+        runner = create_runner(max_workers=1)
+        runner._get_tainted_status = mock_tainted
+
+        tests = []
+        for i in range(10):
+            tests.append(Test(
+                name=f"test{i}",
+                cmd="echo",
+                args=["-n", "ciao"],
+                parallelizable=False,
+            ))
+
+        await runner.schedule(tests)
+
+        assert len(runner.results) == len(tests)
+        assert len(reads) == len(tests) + 1
+
+    async def test_schedule_tainted_after_timeout(self, create_runner):
+        """
+        Test that tainted status is read again before the next test when
+        the previous test timed out.
+        """
+        reads = []
+
+        async def mock_tainted():
+            reads.append(1)
+
+            # kernel is tainted during the second test
+            if len(reads) <= 2:
+                return 0, [""]
+
+            return 1, [TAINED_MSG[0]]
+
+        runner = create_runner(timeout=0.5, max_workers=1)
+        runner._get_tainted_status = mock_tainted
+
+        tests = [
+            Test(name="test0", cmd="echo", args=["-n", "ciao"]),
+            Test(name="test1", cmd="sleep", args=["2"]),
+            Test(name="test2", cmd="echo", args=["-n", "ciao"]),
+        ]
+
+        await runner.schedule(tests)
+
+        assert len(runner.results) == len(tests)
+        assert runner.results[2].passed == 1
+
+    async def test_write_kmsg(self, tmpdir, dummy_framework):
+        """
+        Test if test information is written on /dev/kmsg when command
+        contains special characters and it's executed via sudo shell.
+        """
+        kmsg = tmpdir / "kmsg"
+
+        class SudoSUT(MockHostSUT):
+            """
+            Run commands as SSH SUT does with sudo, writing kmsg data
+            inside a temporary file.
+            """
+
+            async def run_command(
+                    self,
+                    command: str,
+                    cwd: str = None,
+                    env: dict = None,
+                    iobuffer=None) -> dict:
+                if command == "id -u":
+                    return {"stdout": "0\n", "returncode": 0}
+
+                ssh = SSHSUT()
+                ssh._sudo = True
+
+                script = ssh._create_command(
+                    command.replace("/dev/kmsg", str(kmsg)), cwd, env)
+
+                # sudo is not needed to test the shell quoting
+                script = script[len("sudo "):]
+
+                return await super().run_command(script)
+
+        sut = SudoSUT()
+        sut.setup()
+        await sut.communicate()
+
+        try:
+            runner = TestScheduler(
+                sut=sut,
+                framework=dummy_framework,
+                timeout=10,
+                max_workers=1)
+
+            test = Test(
+                name="test(special)",
+                cmd="echo",
+                args=["'single'", '"double"', "$HOME", "a;b", "\\"])
+
+            await runner._write_kmsg(test)
+        finally:
+            await sut.stop()
+
+        assert kmsg.read() == \
+            f"{sys.argv[0]}[{os.getpid()}]: starting test test(special) " \
+            "(echo 'single' \"double\" $HOME a;b \\)\n"
+
     @pytest.mark.parametrize("workers", [1, 10])
     async def test_schedule_kernel_panic(self, workers, create_runner):
         """
@@ -41,6 +41,19 @@ class _TestSUT:
 
     _logger = logging.getLogger("test.asyncsut")
 
+    # sleep time values used by `test_communicate_stop`
+    SUT_STOP_SLEEP_PARAMS = [1, 2]
+
+    def pytest_generate_tests(self, metafunc):
+        """
+        Parametrize `sut_stop_sleep` according with the SUT implementation.
+        """
+        if "sut_stop_sleep" in metafunc.fixturenames:
+            metafunc.parametrize(
+                "sut_stop_sleep",
+                self.SUT_STOP_SLEEP_PARAMS,
+                indirect=True)
+
     def test_config_help(self, sut):
         """
         Test if config_help has the right type.
@@ -84,6 +97,52 @@ class _TestSUT:
         assert code >= 0
         assert isinstance(messages, list)
 
+    async def test_get_tainted_info_parallel(self, sut):
+        """
+        Test get_tainted_info method when it's called in parallel.
+        """
+        await sut.communicate(iobuffer=Printer())
+
+        results = await asyncio.gather(*[
+            sut.get_tainted_info() for _ in range(10)
+        ])
+
+        code, messages = results[0]
+        assert code >= 0
+        assert isinstance(messages, list)
+
+        for result in results:
+            assert result == (code, messages)
+
+    async def test_get_tainted_info_cancel(self, sut):
+        """
+        Test get_tainted_info method when all callers are cancelled.
+        """
+        await sut.communicate(iobuffer=Printer())
+
+        tasks = [
+            libkirk.create_task(sut.get_tainted_info()) for _ in range(2)
+        ]
+
+        await asyncio.sleep(0)
+
+        reading = sut._tainted_task
+        assert reading
+
+        # the read must continue for the remaining caller
+        tasks[0].cancel()
+        await asyncio.sleep(0)
+        assert not reading.done()
+
+        tasks[1].cancel()
+
+        for task in tasks:
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        with pytest.raises(asyncio.CancelledError):
+            await reading
+
     async def test_communicate(self, sut):
         """
         Test communicate method.
@@ -104,12 +163,11 @@ class _TestSUT:
     def sut_stop_sleep(self, request):
         """
         Setup sleep time before calling stop after communicate.
-        By changing multiply factor it's possible to tweak stop sleep and
-        change the behaviour of `test_stop_communicate`.
+        By changing `SUT_STOP_SLEEP_PARAMS` it's possible to tweak stop sleep
+        and change the behaviour of `test_communicate_stop`.
         """
         return request.param * 1.0
 
-    @pytest.mark.parametrize("sut_stop_sleep", [1, 2], indirect=True)
     async def test_communicate_stop(self, sut, sut_stop_sleep):
         """
         Test stop method when running communicate.
@@ -31,6 +31,7 @@ setup(
     extras_require={
         'ssh':  ['asyncssh <= 2.13.2'],
         'ltx':  ['msgpack <= 1.0.5'],
+        'uvloop':  ['uvloop'],
     },
     packages=['libkirk'],
     include_package_data=True,